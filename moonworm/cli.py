@@ -1,7 +1,6 @@
 import argparse
 import json
 import os
-from multiprocessing.sharedctypes import Value
 from pathlib import Path
 from shutil import copyfile
 
@@ -11,7 +10,7 @@ from web3.middleware import geth_poa_middleware
 from moonworm.crawler.ethereum_state_provider import Web3StateProvider
 from moonworm.watch import watch_contract
 
-from .contracts import CU, ERC20, ERC721, CULands
+from .contracts import CU, ERC20, ERC721
 from .crawler.utils import Network
 from .deployment import find_deployment_block
 from .generators.basic import (
@@ -128,7 +127,9 @@ def handle_brownie_generate(args: argparse.Namespace):
         build,
         args.name,
         splitted_relpath_string,
+        format=args.format,
         prod=args.prod,
+        cache_dir=args.cache_dir,
     )
     write_file(interface, os.path.join(args.outdir, args.name + ".py"))
 
@@ -352,6 +353,17 @@ def generate_argument_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Generate shippable python interface, in which abi and bytecode will be included inside the generated file",
     )
+    generate_brownie_parser.add_argument(
+        "--no-format",
+        dest="format",
+        action="store_false",
+        help="Skip formatting the generated code with black (much faster for large ABIs)",
+    )
+    generate_brownie_parser.add_argument(
+        "--cache-dir",
+        default=None,
+        help="Directory in which to cache generated code, so that unchanged contracts are not regenerated",
+    )
     generate_brownie_parser.set_defaults(func=handle_brownie_generate)
 
     generate_parser = subcommands.add_parser(
@@ -1,3 +1,4 @@
+import functools
 import json
 import os
 from typing import Any, Dict, List
@@ -18,21 +19,29 @@ _PATHS = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _read_fixture(relative_path: str) -> str:
+    """
+    Reads a fixture file shipped with moonworm. The fixtures never change at runtime, so each one is
+    read from disk at most once per process.
+    """
+    base_dir = os.path.dirname(__file__)
+    with open(os.path.join(base_dir, relative_path), "r") as ifp:
+        return ifp.read()
+
+
 class MoonwormContract:
     def __init__(self, abi_path: str, bytecode_path: str) -> None:
         self._abi_path = abi_path
         self._bytecode_path = bytecode_path
 
     def abi(self) -> List[Dict[str, Any]]:
-        base_dir = os.path.dirname(__file__)
-        with open(os.path.join(base_dir, self._abi_path), "r") as ifp:
-            abi = json.load(ifp)
+        # Callers are free to modify the ABI they get back, so we parse a fresh copy every time.
+        abi = json.loads(_read_fixture(self._abi_path))
         return abi
 
     def bytecode(self) -> str:
-        base_dir = os.path.dirname(__file__)
-        with open(os.path.join(base_dir, self._bytecode_path), "r") as ifp:
-            bytecode = ifp.read()
+        bytecode = _read_fixture(self._bytecode_path)
         return bytecode
 
 
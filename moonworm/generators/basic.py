@@ -7,10 +7,12 @@ The entrypoints to code generation are:
 - [`generate_contract_cli_content`][moonworm.generators.basic.generate_contract_cli_content]
 """
 
+import functools
 import keyword
 import logging
 import os
-from typing import Any, Dict, List, Set, Union, cast
+import sys
+from typing import Any, Dict, List, Set, Tuple, Union, cast
 
 import black
 import black.mode
@@ -52,12 +54,17 @@ def get_constructor(abi: List[Dict[str, Any]]) -> Dict[str, Any]:
     return DEFAULT_CONSTRUCTOR
 
 
+# black's default formatting mode, constructed once and reused for every call to format_code.
+BLACK_MODE = black.mode.Mode()
+
+
 def format_code(code: str) -> str:
-    formatted_code = black.format_str(code, mode=black.mode.Mode())
+    formatted_code = black.format_str(code, mode=BLACK_MODE)
     return formatted_code
 
 
-def make_annotation(types: list, optional: bool = False):
+@functools.lru_cache(maxsize=256)
+def make_annotation(types: Tuple[str, ...], optional: bool = False):
     annotation = cst.Annotation(annotation=cst.Name(types[0]))
     if len(types) > 1:
         union_slice = []
@@ -93,23 +100,26 @@ def normalize_abi_name(name: str) -> str:
         return name
 
 
+# EVM types which are matched exactly (as opposed to by prefix, like uint256 or bytes32) by
+# python_type.
+EVM_TO_PYTHON_TYPES: Dict[str, str] = {
+    "string": "str",
+    "address": "ChecksumAddress",
+    "bool": "bool",
+    "tuple": "tuple",
+}
+
+
 def python_type(evm_type: str) -> List[str]:
     if evm_type.endswith("]"):
         return ["List"]
+    exact_type = EVM_TO_PYTHON_TYPES.get(evm_type)
+    if exact_type is not None:
+        return [exact_type]
     if evm_type.startswith(("uint", "int")):
         return ["int"]
-    if evm_type.startswith(("int", "int")):
-        return ["int"]
     elif evm_type.startswith("bytes"):
         return ["bytes"]
-    elif evm_type == "string":
-        return ["str"]
-    elif evm_type == "address":
-        return ["ChecksumAddress"]
-    elif evm_type == "bool":
-        return ["bool"]
-    elif evm_type == "tuple":
-        return ["tuple"]
     else:
         return ["Any"]
 
@@ -138,7 +148,7 @@ def generate_contract_class(
                 ),
                 cst.Param(
                     name=cst.Name("contract_address"),
-                    annotation=make_annotation(["ChecksumAddress"]),
+                    annotation=make_annotation(("ChecksumAddress",)),
                 ),
             ]
         ),
@@ -186,7 +196,31 @@ PROTECTED_ARG_NAMES: Set[str] = {
 }
 
 
-def function_spec(function_abi: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
+@functools.lru_cache(maxsize=1024)
+def input_names(abi_name: str) -> Tuple[str, str, str]:
+    """
+    Derives the names under which a function input with the given ABI name appears in generated code:
+    its Python parameter name, its attribute on the parsed command line arguments, and its command
+    line flag. These only depend on the ABI name, and ABIs reuse the same input names (e.g. "to",
+    "amount") many times, so the results are cached.
+
+    The names are interned so that every spec which uses them shares a single string object.
+    """
+    method_name = normalize_abi_name(inflection.underscore(abi_name))
+    args_name = method_name
+    if (
+        args_name.startswith("_")
+        or args_name.endswith("_")
+        or args_name in PROTECTED_ARG_NAMES
+    ):
+        args_name = args_name.strip("_") + "_arg"
+
+    cli_name = f"--{inflection.dasherize(args_name)}"
+
+    return sys.intern(method_name), sys.intern(args_name), sys.intern(cli_name)
+
+
+def function_spec(function_abi: Dict[str, Any]) -> Dict[str, Any]:
     """
     Accepts function interface definitions from smart contract ABIs. An example input:
     {
@@ -245,43 +279,33 @@ def function_spec(function_abi: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
             item_abi_name = f"{default_input_name}{default_counter}"
             default_counter += 1
 
-        item_method_name = normalize_abi_name(inflection.underscore(item_abi_name))
-        item_args_name = item_method_name
-        if (
-            item_args_name.startswith("_")
-            or item_args_name.endswith("_")
-            or item_args_name in PROTECTED_ARG_NAMES
-        ):
-            item_args_name = item_args_name.strip("_") + "_arg"
+        item_method_name, item_args_name, item_cli_name = input_names(item_abi_name)
 
-        item_cli_name = f"--{inflection.dasherize(item_args_name)}"
-
-        item_type = python_type(item["type"])[0]
+        evm_type = item["type"]
+        item_type = python_type(evm_type)[0]
 
         item_cli_type = None
         if item_type in {"int", "str"}:
             item_cli_type = item_type
 
         input_spec: Dict[str, Any] = {
-            "abi": item_abi_name,
+            "abi": sys.intern(item_abi_name),
             "method": item_method_name,
             "cli": item_cli_name,
             "args": item_args_name,
             "type": item_type,
-            "raw_type": item["type"],
+            "raw_type": evm_type,
             "cli_type": item_cli_type,
         }
 
         inputs.append(input_spec)
 
-    transact = True
-    if function_abi.get("stateMutability") == "view":
-        transact = False
+    transact = function_abi.get("stateMutability") != "view"
 
-    spec = {
-        "abi": abi_name,
-        "method": function_name,
-        "cli": cli_name,
+    spec: Dict[str, Any] = {
+        "abi": sys.intern(abi_name),
+        "method": sys.intern(function_name),
+        "cli": sys.intern(cli_name),
         "inputs": inputs,
         "transact": transact,
     }
@@ -289,27 +313,35 @@ def function_spec(function_abi: Dict[str, Any]) -> Dict[str, Dict[str, Any]]:
     return spec
 
 
-def generate_contract_constructor_function(
-    func_object: Dict[str, Any]
-) -> cst.FunctionDef:
+def _function_params(inputs: List[Dict[str, Any]]) -> Tuple[List[str], List[cst.Param]]:
+    """
+    Builds the Python parameter names, and the annotated parameters, of a generated method from the
+    inputs in its ABI. Unnamed inputs are called arg1, arg2, ...
+    """
     default_param_name = "arg"
     default_counter = 1
-    func_params = []
 
     param_names = []
-    for param in func_object["inputs"]:
+    for param in inputs:
         param_name = normalize_abi_name(param["name"])
         if param_name == "":
             param_name = f"{default_param_name}{default_counter}"
             default_counter += 1
-        param_type = make_annotation(python_type(param["type"]))
         param_names.append(param_name)
-        func_params.append(
-            cst.Param(
-                name=cst.Name(value=param_name),
-                annotation=param_type,
-            )
+    func_params = [
+        cst.Param(
+            name=cst.Name(value=param_name),
+            annotation=make_annotation(tuple(python_type(param["type"]))),
         )
+        for param_name, param in zip(param_names, inputs)
+    ]
+    return param_names, func_params
+
+
+def generate_contract_constructor_function(
+    func_object: Dict[str, Any]
+) -> cst.FunctionDef:
+    param_names, func_params = _function_params(func_object["inputs"])
     func_raw_name = normalize_abi_name(func_object["name"])
     func_name = cst.Name(func_raw_name)
 
@@ -327,26 +359,8 @@ def generate_contract_constructor_function(
 
 
 def generate_contract_function(func_object: Dict[str, Any]) -> cst.FunctionDef:
-
-    default_param_name = "arg"
-    default_counter = 1
-    func_params = []
-    func_params.append(cst.Param(name=cst.Name("self")))
-
-    param_names = []
-    for param in func_object["inputs"]:
-        param_name = normalize_abi_name(param["name"])
-        if param_name == "":
-            param_name = f"{default_param_name}{default_counter}"
-            default_counter += 1
-        param_type = make_annotation(python_type(param["type"]))
-        param_names.append(param_name)
-        func_params.append(
-            cst.Param(
-                name=cst.Name(value=param_name),
-                annotation=param_type,
-            )
-        )
+    param_names, input_params = _function_params(func_object["inputs"])
+    func_params = [cst.Param(name=cst.Name("self")), *input_params]
     func_raw_name = normalize_abi_name(func_object["name"])
     func_name = cst.Name(func_raw_name)
 
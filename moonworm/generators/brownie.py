@@ -4,16 +4,25 @@ Generates [`brownie`](https://github.com/eth-brownie/brownie)-compatible binding
 The entrypoint to code generation is [`generate_brownie_interface`][moonworm.generators.brownie.generate_brownie_interface].
 """
 
-import copy
+import functools
+import hashlib
+import json
+import keyword
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import string
+import tempfile
+from typing import Any, Dict, List, Optional, Tuple
 
-import libcst as cst
-from libcst._nodes.statement import SimpleStatementLine
+import black
 
 from ..version import MOONWORM_VERSION
-from .basic import format_code, function_spec, get_constructor, make_annotation
+from .basic import (
+    DEFAULT_CONSTRUCTOR,
+    format_code,
+    function_spec,
+    get_constructor,
+)
 
 BROWNIE_INTERFACE_TEMPLATE_PATH = os.path.join(
     os.path.dirname(__file__), "brownie_contract.py.template"
@@ -21,11 +30,47 @@ BROWNIE_INTERFACE_TEMPLATE_PATH = os.path.join(
 BROWNIE_INTERFACE_PROD_TEMPLATE_PATH = os.path.join(
     os.path.dirname(__file__), "brownie_contract_prod.py.template"
 )
+
+
+def _split_template(template: string.Template) -> List[str]:
+    """
+    Splits a template into alternating literal text and placeholder names: even indices of the
+    result hold literal text and odd indices hold placeholder names. This is done once per template,
+    so that filling one in is a single join rather than a regular expression substitution over the
+    whole template.
+    """
+    source = template.template
+    parts: List[str] = []
+    literal: List[str] = []
+    position = 0
+    for match in template.pattern.finditer(source):
+        literal.append(source[position : match.start()])
+        position = match.end()
+        if match.group("escaped") is not None:
+            literal.append(template.delimiter)
+            continue
+        name = match.group("named") or match.group("braced")
+        if name is None:
+            raise ValueError(
+                f"Invalid placeholder in template at index {match.start()}"
+            )
+        parts.append("".join(literal))
+        parts.append(name)
+        literal = []
+    literal.append(source[position:])
+    parts.append("".join(literal))
+    return parts
+
+
+# The templates are string.Templates (rather than str.format templates) so that the Python code in
+# them does not need to escape its braces. They are compiled once, when this module is imported.
 try:
     with open(BROWNIE_INTERFACE_TEMPLATE_PATH, "r") as ifp:
-        BROWNIE_INTERFACE_TEMPLATE = ifp.read()
+        BROWNIE_INTERFACE_TEMPLATE = string.Template(ifp.read())
     with open(BROWNIE_INTERFACE_PROD_TEMPLATE_PATH, "r") as ifp:
-        BROWNIE_INTERFACE_PROD_TEMPLATE = ifp.read()
+        BROWNIE_INTERFACE_PROD_TEMPLATE = string.Template(ifp.read())
+    _BROWNIE_INTERFACE_PARTS = _split_template(BROWNIE_INTERFACE_TEMPLATE)
+    _BROWNIE_INTERFACE_PROD_PARTS = _split_template(BROWNIE_INTERFACE_PROD_TEMPLATE)
 except Exception as e:
     logging.warn(
         f"WARNING: Could not load cli template from ({BROWNIE_INTERFACE_TEMPLATE_PATH})/({BROWNIE_INTERFACE_PROD_TEMPLATE_PATH}):"
@@ -33,699 +78,391 @@ except Exception as e:
     logging.warn(e)
 
 
+def _handler_preamble(contract_name: str) -> str:
+    """
+    Statements which open every CLI handler that works with a deployed contract.
+    """
+    return f"network.connect(args.network)\ncontract = {contract_name}(args.address)\n"
+
+
+# Printed by CLI handlers after they submit a transaction.
+_VERBOSE_PRINT = "if args.verbose:\n    print(result.info())\n"
+
+# Prelude shared by every generated method which requires a deployed contract.
+_ASSERT_CONTRACT_IS_INSTANTIATED = "self.assert_contract_is_instantiated()"
+
+
+class CodeBuilder:
+    """
+    Accumulates generated Python code line by line.
+
+    Each level of indentation is four spaces. Blank lines are never indented.
+    """
+
+    def __init__(self) -> None:
+        self.lines: List[str] = []
+
+    def emit(self, line: str = "", indent: int = 0) -> None:
+        if line:
+            line = "    " * indent + line
+        self.lines.append(line)
+
+    def emit_block(self, code: str, indent: int = 0) -> None:
+        """
+        Emits every line of code at the given indentation, as a single entry.
+        """
+        if not code:
+            return
+        prefix = "    " * indent
+        self.lines.append(
+            "\n".join(prefix + line if line else line for line in code.splitlines())
+        )
+
+    def code(self) -> str:
+        return "\n".join(self.lines) + "\n"
+
+
+@functools.lru_cache(maxsize=256)
+def _type_hint(types: Tuple[str, ...], optional: bool = False) -> str:
+    """
+    Source code equivalent of basic.make_annotation. ABIs only use a handful of distinct types, so
+    the results are cached.
+    """
+    type_hint = types[0]
+    if len(types) > 1:
+        type_hint = f"Union[{', '.join(types)}]"
+    if optional:
+        type_hint = f"Optional[{type_hint}]"
+    return type_hint
+
+
 def generate_brownie_contract_class(
     abi: List[Dict[str, Any]],
     contract_name: str,
-) -> cst.ClassDef:
-    class_name = contract_name
-    class_constructor = cst.FunctionDef(
-        name=cst.Name("__init__"),
-        body=cst.IndentedBlock(
-            body=[
-                cst.parse_statement(f'self.contract_name = "{contract_name}"'),
-                cst.parse_statement("self.address = contract_address"),
-                cst.parse_statement("self.contract = None"),
-                cst.parse_statement(f'self.abi = get_abi_json("{contract_name}")'),
-                cst.If(
-                    test=cst.Comparison(
-                        left=cst.Attribute(
-                            attr=cst.Name(value="address"),
-                            value=cst.Name(value="self"),
-                        ),
-                        comparisons=[
-                            cst.ComparisonTarget(
-                                operator=cst.IsNot(), comparator=cst.Name(value="None")
-                            )
-                        ],
-                    ),
-                    body=cst.parse_statement(
-                        "self.contract: Optional[Contract] = Contract.from_abi(self.contract_name, self.address, self.abi)"
-                    ),
-                ),
-            ]
-        ),
-        params=cst.Parameters(
-            params=[
-                cst.Param(name=cst.Name("self")),
-                cst.Param(
-                    name=cst.Name("contract_address"),
-                    annotation=make_annotation(["ChecksumAddress"], optional=True),
-                ),
-            ]
-        ),
-    )
+    constructor_abi: Optional[Dict[str, Any]] = None,
+) -> Tuple[str, List[Dict[str, Any]]]:
+    """
+    Generates the source code for the contract class.
 
-    contract_constructor = get_constructor(abi)
-    contract_constructor["name"] = "constructor"
+    constructor_abi, if provided, should be the result of get_constructor(abi). If it is not
+    provided, it is looked up in the ABI.
 
-    class_functions = (
-        [class_constructor]
-        + [
-            generate_brownie_constructor_function(contract_constructor),
-            generate_assert_contract_is_instantiated(),
-            generate_verify_contract(),
-        ]
-        + [
-            generate_brownie_contract_function(function)
-            for function in abi
-            if function["type"] == "function"
-        ]
-    )
-    return cst.ClassDef(
-        name=cst.Name(class_name), body=cst.IndentedBlock(body=class_functions)
-    )
+    Also returns the function_spec of every function in the ABI (in ABI order), so that the CLI
+    generators can reuse them instead of computing them again.
+    """
+    if constructor_abi is None:
+        constructor_abi = get_constructor(abi)
+    address_type = _type_hint(("ChecksumAddress",), optional=True)
+
+    builder = CodeBuilder()
+    builder.emit(f"class {contract_name}:")
+    builder.emit(f"def __init__(self, contract_address: {address_type}):", 1)
+    builder.emit(f'self.contract_name = "{contract_name}"', 2)
+    builder.emit("self.address = contract_address", 2)
+    builder.emit("self.contract = None", 2)
+    builder.emit(f'self.abi = get_abi_json("{contract_name}")', 2)
+    builder.emit("if self.address is not None:", 2)
+    builder.emit(
+        "self.contract: Optional[Contract] = Contract.from_abi(self.contract_name, self.address, self.abi)",
+        3,
+    )
+
+    contract_constructor = {**constructor_abi, "name": "constructor"}
+
+    function_abis = [function for function in abi if function["type"] == "function"]
+    function_specs = [function_spec(function) for function in function_abis]
+
+    class_functions = [
+        generate_brownie_constructor_function(contract_constructor),
+        generate_assert_contract_is_instantiated(),
+        generate_verify_contract(),
+    ] + [
+        generate_brownie_contract_function(function, spec)
+        for function, spec in zip(function_abis, function_specs)
+    ]
+    for class_function in class_functions:
+        builder.emit()
+        builder.emit_block(class_function, 1)
+
+    return builder.code(), function_specs
 
 
-def generate_brownie_constructor_function(
-    func_object: Dict[str, Any]
-) -> cst.FunctionDef:
+def generate_brownie_constructor_function(func_object: Dict[str, Any]) -> str:
     spec = function_spec(func_object)
-    func_params = []
-    func_params.append(cst.Param(name=cst.Name("self")))
-    param_names = []
-    for param in spec["inputs"]:
-        param_type = make_annotation([param["type"]])
-        param_names.append(param["method"])
-        func_params.append(
-            cst.Param(
-                name=cst.Name(value=param["method"]),
-                annotation=param_type,
-            )
-        )
-    func_params.append(cst.Param(name=cst.Name("transaction_config")))
+    inputs = spec["inputs"]
+    func_params = [
+        "self",
+        *[f"{param['method']}: {_type_hint((param['type'],))}" for param in inputs],
+        "transaction_config",
+    ]
+    param_names = [*[param["method"] for param in inputs], "transaction_config"]
 
     func_name = "deploy"
-    param_names.append("transaction_config")
-
-    func_body = cst.IndentedBlock(
-        body=[
-            cst.parse_statement(
-                f"contract_class = contract_from_build(self.contract_name)"
-            ),
-            cst.parse_statement(
-                f"deployed_contract = contract_class.deploy({','.join(param_names)})"
-            ),
-            cst.parse_statement("self.address = deployed_contract.address"),
-            cst.parse_statement("self.contract = deployed_contract"),
-            cst.parse_statement("return deployed_contract.tx"),
-        ]
-    )
 
-    return cst.FunctionDef(
-        name=cst.Name(func_name),
-        params=cst.Parameters(params=func_params),
-        body=func_body,
+    builder = CodeBuilder()
+    builder.emit(f"def {func_name}({', '.join(func_params)}):")
+    builder.emit("contract_class = contract_from_build(self.contract_name)", 1)
+    builder.emit(
+        f"deployed_contract = contract_class.deploy({', '.join(param_names)})", 1
     )
+    builder.emit("self.address = deployed_contract.address", 1)
+    builder.emit("self.contract = deployed_contract", 1)
+    builder.emit("return deployed_contract.tx", 1)
+    return builder.code()
 
 
-def generate_verify_contract() -> cst.FunctionDef:
-    func_name = "verify_contract"
-    func_params = [cst.Param(name=cst.Name("self"))]
-    func_body = cst.IndentedBlock(
-        body=[
-            cst.parse_statement("self.assert_contract_is_instantiated()"),
-            cst.parse_statement(
-                f"contract_class = contract_from_build(self.contract_name)"
-            ),
-            cst.parse_statement("contract_class.publish_source(self.contract)"),
-        ]
-    )
+@functools.lru_cache(maxsize=1)
+def generate_verify_contract() -> str:
+    builder = CodeBuilder()
+    builder.emit("def verify_contract(self):")
+    builder.emit(_ASSERT_CONTRACT_IS_INSTANTIATED, 1)
+    builder.emit("contract_class = contract_from_build(self.contract_name)", 1)
+    builder.emit("contract_class.publish_source(self.contract)", 1)
+    return builder.code()
 
-    return cst.FunctionDef(
-        name=cst.Name(func_name), params=cst.Parameters(func_params), body=func_body
-    )
 
+@functools.lru_cache(maxsize=1)
+def generate_assert_contract_is_instantiated() -> str:
+    builder = CodeBuilder()
+    builder.emit("def assert_contract_is_instantiated(self) -> None:")
+    builder.emit("if self.contract is None:", 1)
+    builder.emit('raise Exception("contract has not been instantiated")', 2)
+    return builder.code()
 
-def generate_assert_contract_is_instantiated() -> cst.FunctionDef:
-    function_body = cst.IndentedBlock(
-        body=[
-            cst.If(
-                test=cst.Comparison(
-                    left=cst.Attribute(
-                        attr=cst.Name(value="contract"), value=cst.Name(value="self")
-                    ),
-                    comparisons=[
-                        cst.ComparisonTarget(
-                            operator=cst.Is(), comparator=cst.Name(value="None")
-                        )
-                    ],
-                ),
-                body=cst.parse_statement(
-                    'raise Exception("contract has not been instantiated")'
-                ),
-            ),
-        ],
-    )
-    function_def = cst.FunctionDef(
-        name=cst.Name(value="assert_contract_is_instantiated"),
-        params=cst.Parameters(
-            params=[cst.Param(name=cst.Name(value="self"))],
-        ),
-        body=function_body,
-        returns=cst.Annotation(annotation=cst.Name(value="None")),
-    )
-    return function_def
 
+# Trailing parameter of every generated contract method which only reads from the blockchain.
+_BLOCK_NUMBER_PARAM = (
+    f'block_number: {_type_hint(("str", "int"), optional=True)} = "latest"'
+)
 
-def generate_brownie_contract_function(func_object: Dict[str, Any]) -> cst.FunctionDef:
-    spec = function_spec(func_object)
-    func_params = []
-    func_params.append(cst.Param(name=cst.Name("self")))
-
-    param_names = []
-    for param in spec["inputs"]:
-        param_type = make_annotation([param["type"]])
-        param_name = param["method"]
-        param_names.append(param_name)
-        func_params.append(
-            cst.Param(
-                name=cst.Name(value=param_name),
-                annotation=param_type,
-            )
-        )
+
+def generate_brownie_contract_function(
+    func_object: Dict[str, Any], spec: Optional[Dict[str, Any]] = None
+) -> str:
+    if spec is None:
+        spec = function_spec(func_object)
+    inputs = spec["inputs"]
+    transact = spec["transact"]
+    func_params = [
+        "self",
+        *[f"{param['method']}: {_type_hint((param['type'],))}" for param in inputs],
+        "transaction_config" if transact else _BLOCK_NUMBER_PARAM,
+    ]
+    param_names = [
+        *[param["method"] for param in inputs],
+        "transaction_config" if transact else "block_identifier=block_number",
+    ]
 
     func_raw_name = spec["abi"]
     func_python_name = spec["method"]
-    func_name = cst.Name(value=func_python_name)
-    if spec["transact"]:
-        func_params.append(cst.Param(name=cst.Name(value="transaction_config")))
-        param_names.append("transaction_config")
+    if transact:
         proxy_call_code = (
-            f"return self.contract.{func_raw_name}({','.join(param_names)})"
+            f"return self.contract.{func_raw_name}({', '.join(param_names)})"
         )
     else:
-
-        func_params.append(
-            cst.Param(
-                name=cst.Name(value="block_number"),
-                annotation=make_annotation(["str", "int"], optional=True),
-                default=cst.SimpleString(value='"latest"'),
-            )
-        )
-        param_names.append("block_identifier=block_number")
         proxy_call_code = (
-            f"return self.contract.{func_raw_name}.call({','.join(param_names)})"
+            f"return self.contract.{func_raw_name}.call({', '.join(param_names)})"
         )
 
-    func_body = cst.IndentedBlock(
-        body=[
-            cst.parse_statement("self.assert_contract_is_instantiated()"),
-            cst.parse_statement(proxy_call_code),
-        ]
-    )
-    func_returns = cst.Annotation(annotation=cst.Name(value="Any"))
+    builder = CodeBuilder()
+    builder.emit(f"def {func_python_name}({', '.join(func_params)}) -> Any:")
+    builder.emit(_ASSERT_CONTRACT_IS_INSTANTIATED, 1)
+    builder.emit(proxy_call_code, 1)
+    return builder.code()
 
-    return cst.FunctionDef(
-        name=func_name,
-        params=cst.Parameters(params=func_params),
-        body=func_body,
-        returns=func_returns,
-    )
 
+# Pairs of (command line argument, brownie transaction config key) which get_transaction_config
+# copies from the parsed arguments into the transaction config when they are set.
+TRANSACTION_CONFIG_ARGUMENTS: List[Tuple[str, str]] = [
+    ("gas_price", "gas_price"),
+    ("max_fee_per_gas", "max_fee"),
+    ("max_priority_fee_per_gas", "priority_fee"),
+    ("confirmations", "required_confs"),
+    ("nonce", "nonce"),
+    ("value", "value"),
+]
 
-def generate_get_transaction_config() -> cst.FunctionDef:
-    function_body = cst.IndentedBlock(
-        body=[
-            cst.parse_statement(
-                "signer = network.accounts.load(args.sender, args.password)"
-            ),
-            cst.parse_statement(
-                'transaction_config: Dict[str, Any] = {"from": signer}'
-            ),
-            cst.If(
-                test=cst.Comparison(
-                    left=cst.Attribute(
-                        attr=cst.Name(value="gas_price"), value=cst.Name(value="args")
-                    ),
-                    comparisons=[
-                        cst.ComparisonTarget(
-                            operator=cst.IsNot(), comparator=cst.Name(value="None")
-                        )
-                    ],
-                ),
-                body=cst.parse_statement(
-                    'transaction_config["gas_price"] = args.gas_price'
-                ),
-            ),
-            cst.If(
-                test=cst.Comparison(
-                    left=cst.Attribute(
-                        attr=cst.Name(value="max_fee_per_gas"),
-                        value=cst.Name(value="args"),
-                    ),
-                    comparisons=[
-                        cst.ComparisonTarget(
-                            operator=cst.IsNot(), comparator=cst.Name(value="None")
-                        )
-                    ],
-                ),
-                body=cst.parse_statement(
-                    'transaction_config["max_fee"] = args.max_fee_per_gas'
-                ),
-            ),
-            cst.If(
-                test=cst.Comparison(
-                    left=cst.Attribute(
-                        attr=cst.Name(value="max_priority_fee_per_gas"),
-                        value=cst.Name(value="args"),
-                    ),
-                    comparisons=[
-                        cst.ComparisonTarget(
-                            operator=cst.IsNot(), comparator=cst.Name(value="None")
-                        )
-                    ],
-                ),
-                body=cst.parse_statement(
-                    'transaction_config["priority_fee"] = args.max_priority_fee_per_gas'
-                ),
-            ),
-            cst.If(
-                test=cst.Comparison(
-                    left=cst.Attribute(
-                        attr=cst.Name(value="confirmations"),
-                        value=cst.Name(value="args"),
-                    ),
-                    comparisons=[
-                        cst.ComparisonTarget(
-                            operator=cst.IsNot(), comparator=cst.Name(value="None")
-                        )
-                    ],
-                ),
-                body=cst.parse_statement(
-                    'transaction_config["required_confs"] = args.confirmations'
-                ),
-            ),
-            cst.If(
-                test=cst.Comparison(
-                    left=cst.Attribute(
-                        attr=cst.Name(value="nonce"),
-                        value=cst.Name(value="args"),
-                    ),
-                    comparisons=[
-                        cst.ComparisonTarget(
-                            operator=cst.IsNot(), comparator=cst.Name(value="None")
-                        )
-                    ],
-                ),
-                body=cst.parse_statement('transaction_config["nonce"] = args.nonce'),
-            ),
-            cst.parse_statement("return transaction_config"),
-        ],
-    )
-    function_def = cst.FunctionDef(
-        name=cst.Name(value="get_transaction_config"),
-        params=cst.Parameters(
-            params=[
-                cst.Param(
-                    name=cst.Name(value="args"),
-                    annotation=cst.Annotation(
-                        annotation=cst.Attribute(
-                            attr=cst.Name(value="Namespace"),
-                            value=cst.Name(value="argparse"),
-                        )
-                    ),
-                )
-            ],
-        ),
-        body=function_body,
-        returns=cst.Annotation(
-            annotation=cst.Subscript(
-                value=cst.Name(value="Dict"),
-                slice=[
-                    cst.SubscriptElement(slice=cst.Index(value=cst.Name(value="str"))),
-                    cst.SubscriptElement(slice=cst.Index(value=cst.Name(value="Any"))),
-                ],
-            )
-        ),
+
+@functools.lru_cache(maxsize=1)
+def generate_get_transaction_config() -> str:
+    builder = CodeBuilder()
+    builder.emit(
+        "def get_transaction_config(args: argparse.Namespace) -> Dict[str, Any]:"
     )
-    return function_def
+    builder.emit("signer = network.accounts.load(args.sender, args.password)", 1)
+    builder.emit('transaction_config: Dict[str, Any] = {"from": signer}', 1)
+    for arg_name, config_key in TRANSACTION_CONFIG_ARGUMENTS:
+        builder.emit(f"if args.{arg_name} is not None:", 1)
+        builder.emit(f'transaction_config["{config_key}"] = args.{arg_name}', 2)
+    builder.emit("return transaction_config", 1)
+    return builder.code()
 
 
 def generate_deploy_handler(
     constructor_abi: Dict[str, Any], contract_name: str
-) -> Optional[cst.FunctionDef]:
+) -> Optional[str]:
     """
     Generates a handler which deploys the given contract to the specified blockchain using the constructor
     with the given signature.
     """
-    # Since we mutate the ABI before passing to function_spec (to conform to its assumptions), make
-    # a copy of the constructor_abi.
-    local_abi = copy.deepcopy(constructor_abi)
-    local_abi["name"] = "deploy"
+    # function_spec requires a name, so we pass it a shallow copy of constructor_abi with the name
+    # overridden. Nested structures are only read, never mutated, so they can be shared.
+    local_abi = {**constructor_abi, "name": "deploy"}
     spec = function_spec(local_abi)
     function_name = spec["method"]
 
-    function_body_raw: List[cst.CSTNode] = []
-
-    # Instantiate the contract
-    function_body_raw.extend(
-        [
-            cst.parse_statement("network.connect(args.network)"),
-            cst.parse_statement("transaction_config = get_transaction_config(args)"),
-            cst.parse_statement(f"contract = {contract_name}(None)"),
-        ]
-    )
-
-    # Call contract method
-    call_args: List[cst.Arg] = []
-    for param in spec["inputs"]:
-        call_args.append(
-            cst.Arg(
-                keyword=cst.Name(value=param["method"]),
-                value=cst.Attribute(
-                    attr=cst.Name(value=param["args"]), value=cst.Name(value="args")
-                ),
-            )
-        )
-
-    call_args.append(
-        cst.Arg(
-            keyword=cst.Name(value="transaction_config"),
-            value=cst.Name(value="transaction_config"),
-        )
-    )
-
-    method_call = cst.Call(
-        func=cst.Attribute(
-            attr=cst.Name(value=spec["method"]),
-            value=cst.Name(value="contract"),
-        ),
-        args=call_args,
-    )
+    call_args = [
+        *[f"{param['method']}=args.{param['args']}" for param in spec["inputs"]],
+        "transaction_config=transaction_config",
+    ]
 
-    method_call_result_statement = cst.SimpleStatementLine(
-        body=[
-            cst.Assign(
-                targets=[cst.AssignTarget(target=cst.Name(value="result"))],
-                value=method_call,
-            )
-        ]
-    )
-    function_body_raw.append(method_call_result_statement)
-
-    function_body_raw.append(cst.parse_statement("print(result)"))
-    verbose_print = cst.If(
-        test=cst.parse_expression("args.verbose"),
-        body=cst.IndentedBlock(
-            body=[
-                cst.parse_statement("print(result.info())"),
-            ]
-        ),
-    )
-    function_body_raw.append(verbose_print)
-
-    function_body = cst.IndentedBlock(body=function_body_raw)
-
-    function_def = cst.FunctionDef(
-        name=cst.Name(value=f"handle_{function_name}"),
-        params=cst.Parameters(
-            params=[
-                cst.Param(
-                    name=cst.Name(value="args"),
-                    annotation=cst.Annotation(
-                        annotation=cst.Attribute(
-                            attr=cst.Name(value="Namespace"),
-                            value=cst.Name(value="argparse"),
-                        )
-                    ),
-                )
-            ],
-        ),
-        body=function_body,
-        returns=cst.Annotation(annotation=cst.Name(value="None")),
-    )
-    return function_def
+    builder = CodeBuilder()
+    builder.emit(f"def handle_{function_name}(args: argparse.Namespace) -> None:")
+    builder.emit("network.connect(args.network)", 1)
+    builder.emit("transaction_config = get_transaction_config(args)", 1)
+    builder.emit(f"contract = {contract_name}(None)", 1)
+    builder.emit(f"result = contract.{function_name}({', '.join(call_args)})", 1)
+    builder.emit("print(result)", 1)
+    builder.emit_block(_VERBOSE_PRINT, 1)
+    return builder.code()
 
 
-def generate_verify_contract_handler(contract_name: str) -> Optional[cst.FunctionDef]:
+def generate_verify_contract_handler(contract_name: str) -> Optional[str]:
     """
     Generates a handler which deploys the given contract to the specified blockchain using the constructor
     with the given signature.
     """
-    function_body_raw: List[cst.CSTNode] = []
-
-    # Instantiate the contract
-    function_body_raw.extend(
-        [
-            cst.parse_statement("network.connect(args.network)"),
-            cst.parse_statement(f"contract = {contract_name}(args.address)"),
-        ]
-    )
-
-    method_call = cst.Call(
-        func=cst.Attribute(
-            attr=cst.Name(value="verify_contract"),
-            value=cst.Name(value="contract"),
-        ),
-        args=[],
-    )
-
-    method_call_result_statement = cst.SimpleStatementLine(
-        body=[
-            cst.Assign(
-                targets=[cst.AssignTarget(target=cst.Name(value="result"))],
-                value=method_call,
-            )
-        ]
-    )
-    function_body_raw.append(method_call_result_statement)
-
-    function_body_raw.append(cst.parse_statement("print(result)"))
-
-    function_body = cst.IndentedBlock(body=function_body_raw)
-
-    function_def = cst.FunctionDef(
-        name=cst.Name(value=f"handle_verify_contract"),
-        params=cst.Parameters(
-            params=[
-                cst.Param(
-                    name=cst.Name(value="args"),
-                    annotation=cst.Annotation(
-                        annotation=cst.Attribute(
-                            attr=cst.Name(value="Namespace"),
-                            value=cst.Name(value="argparse"),
-                        )
-                    ),
-                )
-            ],
-        ),
-        body=function_body,
-        returns=cst.Annotation(annotation=cst.Name(value="None")),
-    )
-    return function_def
+    builder = CodeBuilder()
+    builder.emit("def handle_verify_contract(args: argparse.Namespace) -> None:")
+    builder.emit_block(_handler_preamble(contract_name), 1)
+    builder.emit("result = contract.verify_contract()", 1)
+    builder.emit("print(result)", 1)
+    return builder.code()
 
 
 def generate_cli_handler(
-    function_abi: Dict[str, Any], contract_name: str
-) -> Optional[cst.FunctionDef]:
+    function_abi: Dict[str, Any],
+    contract_name: str,
+    spec: Optional[Dict[str, Any]] = None,
+) -> Optional[str]:
     """
     Generates a handler which translates parsed command line arguments to method calls on the generated
     smart contract interface.
 
     Returns None if it is not appropriate for the given function to have a handler (e.g. fallback or
     receive). constructor is handled separately with a deploy handler.
+
+    If the caller has already computed the function_spec for function_abi, it can pass it as spec to
+    avoid recomputing it.
     """
-    spec = function_spec(function_abi)
+    if spec is None:
+        spec = function_spec(function_abi)
     function_name = spec["method"]
 
-    function_body_raw: List[cst.CSTNode] = []
-
-    # Instantiate the contract
-    function_body_raw.extend(
-        [
-            cst.parse_statement("network.connect(args.network)"),
-            cst.parse_statement(f"contract = {contract_name}(args.address)"),
-        ]
-    )
-
-    # If a transaction is required, extract transaction parameters from CLI
-    requires_transaction = True
-    if function_abi["stateMutability"] == "view":
-        requires_transaction = False
+    # If a transaction is required, extract transaction parameters from CLI. function_spec has
+    # already worked this out from the function's stateMutability.
+    requires_transaction = spec["transact"]
 
+    call_args = [f"{param['method']}=args.{param['args']}" for param in spec["inputs"]]
     if requires_transaction:
-        function_body_raw.append(
-            cst.parse_statement("transaction_config = get_transaction_config(args)")
-        )
+        call_args.append("transaction_config=transaction_config")
+    else:
+        call_args.append("block_number=args.block_number")
 
-    # Call contract method
-    call_args: List[cst.Arg] = []
-    for param in spec["inputs"]:
-        call_args.append(
-            cst.Arg(
-                keyword=cst.Name(value=param["method"]),
-                value=cst.Attribute(
-                    attr=cst.Name(value=param["args"]), value=cst.Name(value="args")
-                ),
-            )
-        )
+    builder = CodeBuilder()
+    builder.emit(f"def handle_{function_name}(args: argparse.Namespace) -> None:")
+    builder.emit_block(_handler_preamble(contract_name), 1)
     if requires_transaction:
-        call_args.append(
-            cst.Arg(
-                keyword=cst.Name(value="transaction_config"),
-                value=cst.Name(value="transaction_config"),
-            )
-        )
-    else:
-        call_args.append(
-            cst.Arg(
-                keyword=cst.Name(value="block_number"),
-                value=cst.Attribute(
-                    attr=cst.Name(value="block_number"), value=cst.Name("args")
-                ),
-            )
-        )
-    method_call = cst.Call(
-        func=cst.Attribute(
-            attr=cst.Name(value=spec["method"]),
-            value=cst.Name(value="contract"),
-        ),
-        args=call_args,
-    )
-    method_call_result_statement = cst.SimpleStatementLine(
-        body=[
-            cst.Assign(
-                targets=[cst.AssignTarget(target=cst.Name(value="result"))],
-                value=method_call,
-            )
-        ]
-    )
-    function_body_raw.append(method_call_result_statement)
+        builder.emit("transaction_config = get_transaction_config(args)", 1)
+    builder.emit(f"result = contract.{function_name}({', '.join(call_args)})", 1)
+    builder.emit("print(result)", 1)
+    if requires_transaction:
+        builder.emit_block(_VERBOSE_PRINT, 1)
+    return builder.code()
+
+
+@functools.lru_cache(maxsize=1)
+def generate_add_default_arguments() -> str:
+    builder = CodeBuilder()
+    builder.emit(
+        "def add_default_arguments(parser: argparse.ArgumentParser, transact: bool) -> None:"
+    )
+    builder.emit(
+        'parser.add_argument("--network", required=True, help="Name of brownie network to connect to")',
+        1,
+    )
+    builder.emit(
+        'parser.add_argument("--address", required=False, help="Address of deployed contract to connect to")',
+        1,
+    )
+    # TODO(zomglings): The generated code could be confusing for users. Fix this so that it adds additional arguments as part of the "if" statement
+    builder.emit("if not transact:", 1)
+    builder.emit(
+        'parser.add_argument("--block-number", required=False, type=int, help="Call at the given block number, defaults to latest")',
+        2,
+    )
+    builder.emit("return", 2)
+    for argument in [
+        '"--sender", required=True, help="Path to keystore file for transaction sender"',
+        '"--password", required=False, help="Password to keystore file (if you do not provide it, you will be prompted for it)"',
+        '"--gas-price", default=None, help="Gas price at which to submit transaction"',
+        '"--max-fee-per-gas", default=None, help="Max fee per gas for EIP1559 transactions"',
+        '"--max-priority-fee-per-gas", default=None, help="Max priority fee per gas for EIP1559 transactions"',
+        '"--confirmations", type=int, default=None, help="Number of confirmations to await before considering a transaction completed"',
+        '"--nonce", type=int, default=None, help="Nonce for the transaction (optional)"',
+        '"--value", default=None, help="Value of the transaction in wei(optional)"',
+        '"--verbose", action="store_true", help="Print verbose output"',
+    ]:
+        builder.emit(f"parser.add_argument({argument})", 1)
+    return builder.code()
+
+
+# Extra arguments to add_argument for parameters whose Python types argparse cannot parse on its own,
+# keyed by the "type" in their function_spec.
+_ARGPARSE_TYPE_ARGS: Dict[str, List[str]] = {
+    "List": ['nargs=u"+"'],
+    "bool": ["type=boolean_argument_type"],
+    "bytes": ["type=bytes_argument_type"],
+    "tuple": ["type=eval"],
+}
+
+
+def _add_argument_call(subparser_name: str, param: Dict[str, Any]) -> str:
+    """
+    Generates the add_argument call which adds the given function_spec input to the given subparser.
+    """
+    call_args = [
+        f'u"{param["cli"]}"',
+        "required=True",
+        f'help=u"Type: {param["raw_type"]}"',
+    ]
+    if param["cli_type"] is not None:
+        call_args.append(f"type={param['cli_type']}")
 
-    function_body_raw.append(cst.parse_statement("print(result)"))
+    call_args.extend(_ARGPARSE_TYPE_ARGS.get(param["type"], []))
 
-    if requires_transaction:
-        verbose_print = cst.If(
-            test=cst.parse_expression("args.verbose"),
-            body=cst.IndentedBlock(
-                body=[
-                    cst.parse_statement("print(result.info())"),
-                ]
-            ),
-        )
-        function_body_raw.append(verbose_print)
-
-    function_body = cst.IndentedBlock(body=function_body_raw)
-
-    function_def = cst.FunctionDef(
-        name=cst.Name(value=f"handle_{function_name}"),
-        params=cst.Parameters(
-            params=[
-                cst.Param(
-                    name=cst.Name(value="args"),
-                    annotation=cst.Annotation(
-                        annotation=cst.Attribute(
-                            attr=cst.Name(value="Namespace"),
-                            value=cst.Name(value="argparse"),
-                        )
-                    ),
-                )
-            ],
-        ),
-        body=function_body,
-        returns=cst.Annotation(annotation=cst.Name(value="None")),
-    )
-    return function_def
-
-
-def generate_add_default_arguments() -> cst.FunctionDef:
-    function_body = cst.IndentedBlock(
-        body=[
-            cst.parse_statement(
-                'parser.add_argument("--network", required=True, help="Name of brownie network to connect to")'
-            ),
-            cst.parse_statement(
-                'parser.add_argument("--address", required=False, help="Address of deployed contract to connect to")'
-            ),
-            # TODO(zomglings): The generated code could be confusing for users. Fix this so that it adds additional arguments as part of the "if" statement
-            cst.If(
-                test=cst.UnaryOperation(
-                    operator=cst.Not(), expression=cst.Name(value="transact")
-                ),
-                body=cst.IndentedBlock(
-                    body=[
-                        cst.parse_statement(
-                            'parser.add_argument("--block-number", required=False, type=int, help="Call at the given block number, defaults to latest")'
-                        ),
-                        cst.parse_statement("return"),
-                    ]
-                ),
-            ),
-            cst.parse_statement(
-                'parser.add_argument("--sender", required=True, help="Path to keystore file for transaction sender")'
-            ),
-            cst.parse_statement(
-                'parser.add_argument("--password", required=False, help="Password to keystore file (if you do not provide it, you will be prompted for it)")'
-            ),
-            cst.parse_statement(
-                'parser.add_argument("--gas-price", default=None, help="Gas price at which to submit transaction")'
-            ),
-            cst.parse_statement(
-                'parser.add_argument("--max-fee-per-gas", default=None, help="Max fee per gas for EIP1559 transactions")'
-            ),
-            cst.parse_statement(
-                'parser.add_argument("--max-priority-fee-per-gas", default=None, help="Max priority fee per gas for EIP1559 transactions")'
-            ),
-            cst.parse_statement(
-                'parser.add_argument("--confirmations", type=int, default=None, help="Number of confirmations to await before considering a transaction completed")'
-            ),
-            cst.parse_statement(
-                'parser.add_argument("--nonce", type=int, default=None, help="Nonce for the transaction (optional)")'
-            ),
-            cst.parse_statement(
-                'parser.add_argument("--value", default=None, help="Value of the transaction in wei(optional)")'
-            ),
-            cst.parse_statement(
-                'parser.add_argument("--verbose", action="store_true", help="Print verbose output")'
-            ),
-        ],
-    )
-    function_def = cst.FunctionDef(
-        name=cst.Name(value="add_default_arguments"),
-        params=cst.Parameters(
-            params=[
-                cst.Param(
-                    name=cst.Name(value="parser"),
-                    annotation=cst.Annotation(
-                        annotation=cst.Attribute(
-                            attr=cst.Name(value="ArgumentParser"),
-                            value=cst.Name(value="argparse"),
-                        )
-                    ),
-                ),
-                cst.Param(
-                    name=cst.Name(value="transact"),
-                    annotation=cst.Annotation(
-                        annotation=cst.Name(value="bool"),
-                    ),
-                ),
-            ],
-        ),
-        body=function_body,
-        returns=cst.Annotation(annotation=cst.Name(value="None")),
-    )
-    return function_def
+    return f"{subparser_name}.add_argument({', '.join(call_args)})"
 
 
 def generate_cli_generator(
-    abi: List[Dict[str, Any]], contract_name: Optional[str] = None
-) -> cst.FunctionDef:
+    abi: List[Dict[str, Any]],
+    contract_name: Optional[str] = None,
+    function_specs: Optional[List[Dict[str, Any]]] = None,
+    constructor_abi: Optional[Dict[str, Any]] = None,
+) -> str:
     """
     Generates a generate_cli function that creates a CLI for the generated contract.
+
+    function_specs, if provided, should be the function_spec of every function in the ABI (in ABI
+    order). If it is not provided, the specs are computed from the ABI. Likewise, constructor_abi
+    defaults to get_constructor(abi).
     """
+    if constructor_abi is None:
+        constructor_abi = get_constructor(abi)
     if contract_name is None:
         contract_name = "generated contract"
-    statements: List[cst.SimpleStatementLine] = [
-        cst.parse_statement(
-            f'parser = argparse.ArgumentParser(description="CLI for {contract_name}")'
-        ),
-        cst.parse_statement("parser.set_defaults(func=lambda _: parser.print_help())"),
-        cst.parse_statement("subcommands = parser.add_subparsers()"),
-    ]
 
-    constructor_abi = get_constructor(abi)
-    constructor_abi["name"] = "deploy"
-    constructor_spec = function_spec(constructor_abi)
+    constructor_spec = function_spec({**constructor_abi, "name": "deploy"})
 
     verify_contract_spec = {
         "method": "verify_contract",
@@ -735,140 +472,56 @@ def generate_cli_generator(
     }
 
     specs: List[Dict[str, Any]] = [constructor_spec, verify_contract_spec]
-    specs.extend([function_spec(item) for item in abi if item["type"] == "function"])
+    if function_specs is None:
+        function_specs = [
+            function_spec(item) for item in abi if item["type"] == "function"
+        ]
+    specs.extend(function_specs)
 
+    builder = CodeBuilder()
+    builder.emit("def generate_cli() -> argparse.ArgumentParser:")
+    builder.emit(
+        f'parser = argparse.ArgumentParser(description="CLI for {contract_name}")', 1
+    )
+    builder.emit("parser.set_defaults(func=lambda _: parser.print_help())", 1)
+    builder.emit("subcommands = parser.add_subparsers()", 1)
     for spec in specs:
-        subparser_statements: List[SimpleStatementLine] = [cst.Newline()]
-
         subparser_name = f'{spec["method"]}_parser'
-
-        subparser_statements.append(
-            cst.parse_statement(
-                f'{subparser_name} = subcommands.add_parser("{spec["cli"]}")'
-            )
-        )
-        subparser_statements.append(
-            cst.parse_statement(
-                f'add_default_arguments({subparser_name}, {spec["transact"]})'
-            )
-        )
-
+        builder.emit()
+        builder.emit(f'{subparser_name} = subcommands.add_parser("{spec["cli"]}")', 1)
+        builder.emit(f"add_default_arguments({subparser_name}, {spec['transact']})", 1)
         for param in spec["inputs"]:
-            call_args = [
-                cst.Arg(
-                    value=cst.SimpleString(value=f'u"{param["cli"]}"'),
-                ),
-                cst.Arg(
-                    keyword=cst.Name(value="required"),
-                    value=cst.Name(value="True"),
-                ),
-                cst.Arg(
-                    keyword=cst.Name(value="help"),
-                    value=cst.SimpleString(value=f'u"Type: {param["raw_type"]}"'),
-                ),
-            ]
-            if param["cli_type"] is not None:
-                call_args.append(
-                    cst.Arg(
-                        keyword=cst.Name(value="type"),
-                        value=cst.Name(param["cli_type"]),
-                    ),
-                )
-
-            if param["type"] == "List":
-                call_args.append(
-                    cst.Arg(
-                        keyword=cst.Name(value="nargs"),
-                        value=cst.SimpleString(value='u"+"'),
-                    ),
-                )
-            elif param["type"] == "bool":
-                call_args.append(
-                    cst.Arg(
-                        keyword=cst.Name(value="type"),
-                        value=cst.parse_expression("boolean_argument_type"),
-                    ),
-                )
-            elif param["type"] == "bytes":
-                call_args.append(
-                    cst.Arg(
-                        keyword=cst.Name(value="type"),
-                        value=cst.parse_expression("bytes_argument_type"),
-                    ),
-                )
-            elif param["type"] == "tuple":
-                call_args.append(
-                    cst.Arg(
-                        keyword=cst.Name(value="type"),
-                        value=cst.parse_expression("eval"),
-                    ),
-                )
+            builder.emit(_add_argument_call(subparser_name, param), 1)
+        builder.emit(f"{subparser_name}.set_defaults(func=handle_{spec['method']})", 1)
+        builder.emit()
+    builder.emit("return parser", 1)
+    return builder.code()
 
-            add_argument_call = cst.Call(
-                func=cst.Attribute(
-                    attr=cst.Name(value="add_argument"),
-                    value=cst.Name(value=subparser_name),
-                ),
-                args=call_args,
-            )
-            add_argument_statement = cst.SimpleStatementLine(
-                body=[cst.Expr(value=add_argument_call)]
-            )
-            subparser_statements.append(add_argument_statement)
 
-        subparser_statements.append(
-            cst.parse_statement(
-                f"{subparser_name}.set_defaults(func=handle_{spec['method']})"
-            )
-        )
-        subparser_statements.append(cst.Newline())
-        statements.extend(subparser_statements)
-
-    statements.append(cst.parse_statement("return parser"))
-
-    function_body = cst.IndentedBlock(body=statements)
-    function_def = cst.FunctionDef(
-        name=cst.Name(value="generate_cli"),
-        params=cst.Parameters(params=[]),
-        body=function_body,
-        returns=cst.Annotation(
-            annotation=cst.Attribute(
-                attr=cst.Name(value="ArgumentParser"), value=cst.Name(value="argparse")
-            )
-        ),
-    )
-    return function_def
+@functools.lru_cache(maxsize=1)
+def generate_main() -> str:
+    builder = CodeBuilder()
+    builder.emit("def main() -> None:")
+    builder.emit("parser = generate_cli()", 1)
+    builder.emit("args = parser.parse_args()", 1)
+    builder.emit("args.func(args)", 1)
+    return builder.code()
 
 
-def generate_main() -> cst.FunctionDef:
-    statements: List[cst.SimpleStatementLine] = [
-        cst.parse_statement("parser = generate_cli()"),
-        cst.parse_statement("args = parser.parse_args()"),
-        cst.parse_statement("args.func(args)"),
-    ]
-    function_body = cst.IndentedBlock(body=statements)
-    function_def = cst.FunctionDef(
-        name=cst.Name(value="main"),
-        params=cst.Parameters(params=[]),
-        body=function_body,
-        returns=cst.Annotation(annotation=cst.Name(value="None")),
-    )
-    return function_def
-
-
-def generate_runner() -> cst.If:
-    module = cst.parse_module(
-        """
-if __name__ == "__main__":
-    main()
-    """
-    )
-    return module.body[0]
+@functools.lru_cache(maxsize=1)
+def generate_runner() -> str:
+    builder = CodeBuilder()
+    builder.emit('if __name__ == "__main__":')
+    builder.emit("main()", 1)
+    return builder.code()
 
 
 def generate_brownie_cli(
-    abi: List[Dict[str, Any]], contract_name: str
-) -> List[cst.FunctionDef]:
+    abi: List[Dict[str, Any]],
+    contract_name: str,
+    function_specs: Optional[List[Dict[str, Any]]] = None,
+    constructor_abi: Optional[Dict[str, Any]] = None,
+) -> str:
     """
     Generates an argparse CLI to a brownie smart contract using the generated smart contract interface.
 
@@ -879,33 +532,82 @@ def generate_brownie_cli(
 
     2. `contract_name`: Name for the smart contract
 
+    3. `function_specs`: (Optional) The function_spec of every function in the ABI, in ABI order, as
+    returned by [`generate_brownie_contract_class`][moonworm.generators.brownie.generate_brownie_contract_class].
+    If not provided, they are computed from the ABI.
+
+    4. `constructor_abi`: (Optional) The constructor of the smart contract, as returned by
+    [`get_constructor`][moonworm.generators.basic.get_constructor]. If not provided, it is looked up in the ABI.
+
     ## Outputs
 
-    Concrete syntax tree representation of the generated code.
+    The generated Python source code for the CLI.
     """
-    get_transaction_config_function = generate_get_transaction_config()
-    add_default_arguments_function = generate_add_default_arguments()
-    add_deploy_handler = generate_deploy_handler(get_constructor(abi), contract_name)
-    add_verify_contract_handler = generate_verify_contract_handler(contract_name)
+    # A single pass over the ABI gives us both the constructor and the functions which get handlers.
+    abis_by_type: Dict[Optional[str], List[Dict[str, Any]]] = {}
+    for item in abi:
+        abis_by_type.setdefault(item.get("type"), []).append(item)
+
+    if constructor_abi is None:
+        constructor_abi = abis_by_type.get("constructor", [DEFAULT_CONSTRUCTOR])[0]
+    function_abis = [
+        function_abi
+        for function_abi in abis_by_type.get("function", [])
+        if function_abi.get("name") is not None
+    ]
+    if function_specs is None:
+        function_specs = [function_spec(function_abi) for function_abi in function_abis]
+
     handlers = [
-        get_transaction_config_function,
-        add_default_arguments_function,
-        add_deploy_handler,
-        add_verify_contract_handler,
+        generate_deploy_handler(constructor_abi, contract_name),
+        generate_verify_contract_handler(contract_name),
+        *[
+            generate_cli_handler(function_abi, contract_name, spec)
+            for function_abi, spec in zip(function_abis, function_specs)
+        ],
     ]
-    handlers.extend(
-        [
-            generate_cli_handler(function_abi, contract_name)
-            for function_abi in abi
-            if function_abi.get("type") == "function"
-            and function_abi.get("name") is not None
-        ]
-    )
-    nodes: List[cst.CSTNode] = [handler for handler in handlers if handler is not None]
-    nodes.append(generate_cli_generator(abi, contract_name))
-    nodes.append(generate_main())
-    nodes.append(generate_runner())
-    return nodes
+    sources = [
+        generate_get_transaction_config(),
+        generate_add_default_arguments(),
+        *[handler for handler in handlers if handler is not None],
+        generate_cli_generator(abi, contract_name, function_specs, constructor_abi),
+        generate_main(),
+        generate_runner(),
+    ]
+    return "\n\n".join(sources)
+
+
+def _interface_cache_path(
+    cache_dir: str,
+    abi: List[Dict[str, Any]],
+    contract_build: Optional[Dict[str, Any]],
+    contract_name: str,
+    relative_path: str,
+    cli: bool,
+    format: bool,
+    prod: bool,
+) -> str:
+    """
+    Path under cache_dir at which the interface generated from the given inputs is stored. The key
+    covers every input which affects the generated code, as well as the moonworm version (and the
+    black version, for formatted code), so that upgrading either invalidates the cache.
+    """
+    key_data = {
+        "moonworm_version": MOONWORM_VERSION,
+        "abi": abi,
+        "contract_build": contract_build,
+        "contract_name": contract_name,
+        "relative_path": relative_path,
+        "cli": cli,
+        "format": format,
+        "prod": prod,
+    }
+    if format:
+        # Formatted output depends on the version of black that formatted it.
+        key_data["black_version"] = black.__version__
+    serialized_key = json.dumps(key_data, sort_keys=True, separators=(",", ":"))
+    key = hashlib.blake2b(serialized_key.encode("utf-8"), digest_size=20).hexdigest()
+    return os.path.join(cache_dir, f"{key}.py")
 
 
 def generate_brownie_interface(
@@ -916,6 +618,7 @@ def generate_brownie_interface(
     cli: bool = True,
     format: bool = True,
     prod: bool = False,
+    cache_dir: Optional[str] = None,
 ) -> str:
     """
     Generates Python code which allows you to interact with a smart contract with a given ABI, build data, and a given name.
@@ -942,37 +645,108 @@ def generate_brownie_interface(
     7. `prod`: If True, creates a self-contained file. Generated code will not require reference to an
     existing brownie project at its runtime.
 
+    8. `cache_dir`: (Optional) Directory in which to cache generated code. If provided, code generated
+    from exactly the same inputs (by the same version of moonworm) is read from this directory instead
+    of being generated (and formatted) again.
+
 
     ## Outputs
     The generated code as a string.
     """
-    contract_class = generate_brownie_contract_class(abi, contract_name)
-    module_body = [contract_class]
-
-    if cli:
-        contract_cli_functions = generate_brownie_cli(abi, contract_name)
-        module_body.extend(contract_cli_functions)
+    # contract_name is pasted verbatim into the generated code as a class name.
+    if not contract_name.isidentifier() or keyword.iskeyword(contract_name):
+        raise ValueError(
+            f"generate_brownie_interface -- Invalid contract name: {contract_name}"
+        )
 
-    contract_body = cst.Module(body=module_body).code
+    prod_build: Optional[Dict[str, Any]] = None
     if prod:
-        content = BROWNIE_INTERFACE_PROD_TEMPLATE.format(
-            contract_abi=abi,
-            contract_build={
-                "bytecode": contract_build["bytecode"],
-                "abi": contract_build["abi"],
-                "contractName": contract_build["contractName"],
-            },
-            contract_body=contract_body,
-            moonworm_version=MOONWORM_VERSION,
+        prod_build = {
+            "bytecode": contract_build["bytecode"],
+            "abi": contract_build["abi"],
+            "contractName": contract_build["contractName"],
+        }
+
+    cache_path: Optional[str] = None
+    if cache_dir is not None:
+        cache_path = _interface_cache_path(
+            cache_dir,
+            abi,
+            prod_build,
+            contract_name,
+            relative_path,
+            cli,
+            format,
+            prod,
         )
+        if os.path.isfile(cache_path):
+            try:
+                with open(cache_path, "r") as ifp:
+                    return ifp.read()
+            except OSError as e:
+                # The cache is only an optimization, so an unreadable entry is regenerated.
+                logging.warn(
+                    f"WARNING: Could not read cached interface from {cache_path}:"
+                )
+                logging.warn(e)
+
+    if prod:
+        template_parts = _BROWNIE_INTERFACE_PROD_PARTS
+        substitutions: Dict[str, Any] = {
+            "contract_build": prod_build,
+            "moonworm_version": MOONWORM_VERSION,
+        }
     else:
-        content = BROWNIE_INTERFACE_TEMPLATE.format(
-            contract_body=contract_body,
-            moonworm_version=MOONWORM_VERSION,
-            relative_path=relative_path,
+        template_parts = _BROWNIE_INTERFACE_PARTS
+        substitutions = {
+            "moonworm_version": MOONWORM_VERSION,
+            "relative_path": relative_path,
+        }
+
+    constructor_abi = get_constructor(abi)
+    contract_class, function_specs = generate_brownie_contract_class(
+        abi, contract_name, constructor_abi
+    )
+
+    contract_body = [contract_class]
+    if cli:
+        contract_body.append("\n\n")
+        contract_body.append(
+            generate_brownie_cli(abi, contract_name, function_specs, constructor_abi)
         )
 
+    # The generated code is joined into the file in one go, instead of being accumulated into a
+    # contract body which is then copied again into the template.
+    parts: List[str] = []
+    for index, part in enumerate(template_parts):
+        if index % 2 == 0:
+            parts.append(part)
+        elif part == "contract_body":
+            parts.extend(contract_body)
+        else:
+            parts.append(str(substitutions[part]))
+    content = "".join(parts)
+
     if format:
         content = format_code(content)
 
+    if cache_path is not None:
+        # Write to a temporary file first so that concurrent runs never read a partial entry.
+        entry_dir = os.path.dirname(cache_path)
+        os.makedirs(entry_dir, exist_ok=True)
+        temp_fd, temp_path = tempfile.mkstemp(dir=entry_dir, suffix=".tmp")
+        try:
+            with os.fdopen(temp_fd, "w") as ofp:
+                ofp.write(content)
+            # mkstemp creates the file readable only by its owner. Cache entries get the same
+            # permissions as any other file created under the current umask, so that a cache
+            # directory can be shared.
+            umask = os.umask(0)
+            os.umask(umask)
+            os.chmod(temp_path, 0o666 & ~umask)
+            os.replace(temp_path, cache_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
     return content
@@ -25,6 +25,7 @@ class TestFunctionSpec(unittest.TestCase):
                     "cli": "--token-id-arg",
                     "args": "token_id_arg",
                     "type": "int",
+                    "raw_type": "uint256",
                     "cli_type": "int",
                 },
             ],
@@ -55,6 +56,7 @@ class TestFunctionSpec(unittest.TestCase):
                     "cli": "--owner",
                     "args": "owner",
                     "type": "ChecksumAddress",
+                    "raw_type": "address",
                     "cli_type": None,
                 },
                 {
@@ -63,6 +65,7 @@ class TestFunctionSpec(unittest.TestCase):
                     "cli": "--index",
                     "args": "index",
                     "type": "int",
+                    "raw_type": "uint256",
                     "cli_type": "int",
                 },
             ],
@@ -0,0 +1,310 @@
+import argparse
+import copy
+import glob
+import hashlib
+import json
+import os
+import tempfile
+import types
+import unittest
+from typing import Any, Dict
+from unittest import mock
+
+import black
+
+from moonworm.contracts import ERC20
+from moonworm.generators.brownie import (
+    CodeBuilder,
+    generate_brownie_interface,
+    generate_get_transaction_config,
+)
+
+
+def erc20_contract_build() -> Dict[str, Any]:
+    """
+    Brownie build information for the OwnableERC20 contract bundled with moonworm.
+    """
+    return {
+        "abi": ERC20.abi(),
+        "bytecode": ERC20.bytecode(),
+        "contractName": "OwnableERC20",
+    }
+
+
+class TestCodeBuilder(unittest.TestCase):
+    def test_emit_block_indents_lines(self):
+        builder = CodeBuilder()
+        builder.emit_block("if x:\n    return x\n", 1)
+        self.assertEqual(builder.code(), "    if x:\n        return x\n")
+
+    def test_emit_block_leaves_blank_lines_unindented(self):
+        for code, expected in [
+            ("\na = 1", "\n    a = 1\n"),
+            ("a = 1\n\n", "    a = 1\n\n"),
+            ("a = 1\n\nb = 2", "    a = 1\n\n    b = 2\n"),
+        ]:
+            with self.subTest(code=code):
+                builder = CodeBuilder()
+                builder.emit_block(code, 1)
+                self.assertEqual(builder.code(), expected)
+
+    def test_emit_block_skips_empty_code(self):
+        builder = CodeBuilder()
+        builder.emit_block("", 1)
+        self.assertEqual(builder.lines, [])
+
+
+class TestGenerateBrownieInterface(unittest.TestCase):
+    def setUp(self):
+        self.contract_build = erc20_contract_build()
+        self.abi = self.contract_build["abi"]
+
+    def test_abi_is_not_modified(self):
+        original_abi = copy.deepcopy(self.abi)
+        for prod in [False, True]:
+            generate_brownie_interface(
+                self.abi,
+                self.contract_build,
+                "OwnableERC20",
+                '".."',
+                format=False,
+                prod=prod,
+            )
+            self.assertListEqual(self.abi, original_abi)
+
+    def test_invalid_contract_name(self):
+        for contract_name in ["Ownable ERC20", "1ERC20", "class", ""]:
+            with self.assertRaises(ValueError):
+                generate_brownie_interface(
+                    self.abi, self.contract_build, contract_name, '".."', format=False
+                )
+
+
+class TestGenerateBrownieInterfaceCache(unittest.TestCase):
+    def setUp(self):
+        self.contract_build = erc20_contract_build()
+        self.abi = self.contract_build["abi"]
+        self._cache_dir = tempfile.TemporaryDirectory()
+        self.cache_dir = self._cache_dir.name
+
+    def tearDown(self):
+        self._cache_dir.cleanup()
+
+    def generate(self, format: bool = False, prod: bool = False) -> str:
+        return generate_brownie_interface(
+            self.abi,
+            self.contract_build,
+            "OwnableERC20",
+            '".."',
+            format=format,
+            prod=prod,
+            cache_dir=self.cache_dir,
+        )
+
+    def test_cache_miss_writes_entry(self):
+        content = self.generate()
+        entries = os.listdir(self.cache_dir)
+        self.assertEqual(len(entries), 1)
+        self.assertTrue(entries[0].endswith(".py"))
+        with open(os.path.join(self.cache_dir, entries[0]), "r") as ifp:
+            self.assertEqual(ifp.read(), content)
+
+    def test_cache_hit_returns_identical_content(self):
+        content = self.generate()
+        self.assertEqual(self.generate(), content)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 1)
+        self.assertEqual(
+            content,
+            generate_brownie_interface(
+                self.abi, self.contract_build, "OwnableERC20", '".."', format=False
+            ),
+        )
+
+    def test_cache_entry_honours_umask(self):
+        umask = os.umask(0o022)
+        try:
+            self.generate()
+        finally:
+            os.umask(umask)
+        (entry,) = os.listdir(self.cache_dir)
+        mode = os.stat(os.path.join(self.cache_dir, entry)).st_mode & 0o777
+        self.assertEqual(mode, 0o644)
+
+    def test_unreadable_cache_entry_is_regenerated(self):
+        content = self.generate()
+        (entry,) = os.listdir(self.cache_dir)
+        entry_path = os.path.join(self.cache_dir, entry)
+        with open(entry_path, "w") as ofp:
+            ofp.write("stale")
+
+        builtin_open = open
+
+        def unreadable_entry_open(path, mode="r", *args, **kwargs):
+            if path == entry_path and mode == "r":
+                raise PermissionError(f"Permission denied: {path}")
+            return builtin_open(path, mode, *args, **kwargs)
+
+        with mock.patch("builtins.open", side_effect=unreadable_entry_open):
+            self.assertEqual(self.generate(), content)
+
+        with open(entry_path, "r") as ifp:
+            self.assertEqual(ifp.read(), content)
+
+    def test_format_and_prod_use_separate_entries(self):
+        contents = {}
+        for format in [False, True]:
+            for prod in [False, True]:
+                contents[(format, prod)] = self.generate(format=format, prod=prod)
+        self.assertEqual(len(os.listdir(self.cache_dir)), 4)
+        self.assertEqual(len(set(contents.values())), 4)
+        for (format, prod), content in contents.items():
+            self.assertEqual(self.generate(format=format, prod=prod), content)
+
+
+FIXTURE_ABIS_DIR = os.path.join(
+    os.path.dirname(__file__), "..", "..", "fixture", "abis"
+)
+EXPECTED_INTERFACES_DIR = os.path.join(os.path.dirname(__file__), "expected_interfaces")
+EXPECTED_DIGESTS_PATH = os.path.join(EXPECTED_INTERFACES_DIR, "digests.json")
+# Fixtures whose expected interfaces are stored in full, so that changes to them show up as diffs.
+FULL_EXPECTED_INTERFACES = ["Greeter"]
+UPDATE_EXPECTED_INTERFACES_ENV_VAR = "MOONWORM_UPDATE_EXPECTED_INTERFACES"
+
+
+def generate_fixture_interfaces(format: bool) -> Dict[str, str]:
+    """
+    Generates the brownie interface for every ABI bundled with moonworm, keyed by contract name.
+    """
+    interfaces: Dict[str, str] = {}
+    for abi_path in sorted(glob.glob(os.path.join(FIXTURE_ABIS_DIR, "*.json"))):
+        name = os.path.splitext(os.path.basename(abi_path))[0]
+        with open(abi_path, "r") as ifp:
+            abi = json.load(ifp)
+        contract_build = {"abi": abi, "bytecode": "0x00", "contractName": name}
+        interfaces[name] = generate_brownie_interface(
+            abi, contract_build, name, '".."', format=format
+        )
+    return interfaces
+
+
+def expected_interface_path(name: str, format: bool) -> str:
+    kind = "formatted" if format else "unformatted"
+    return os.path.join(EXPECTED_INTERFACES_DIR, f"{name}.{kind}.txt")
+
+
+def update_expected_interfaces() -> None:
+    """
+    Regenerates the expected interfaces from the current generators (and the installed black).
+    """
+    digests: Dict[str, Dict[str, str]] = {}
+    for format in [False, True]:
+        kind = "formatted" if format else "unformatted"
+        for name, content in generate_fixture_interfaces(format).items():
+            digests.setdefault(name, {})[kind] = hashlib.sha256(
+                content.encode("utf-8")
+            ).hexdigest()
+            if name in FULL_EXPECTED_INTERFACES:
+                with open(expected_interface_path(name, format), "w") as ofp:
+                    ofp.write(content)
+
+    with open(EXPECTED_DIGESTS_PATH, "w") as ofp:
+        json.dump(
+            {"black_version": black.__version__, "digests": digests},
+            ofp,
+            indent=4,
+            sort_keys=True,
+        )
+        ofp.write("\n")
+
+
+class TestGeneratedInterfaces(unittest.TestCase):
+    """
+    Checks the code generated for every ABI bundled with moonworm against the expected output in
+    expected_interfaces/. Changes to the generators which are meant to be purely internal must not
+    change a single byte of the generated code.
+
+    The expected output is stored as SHA-256 digests, plus the full code for the fixtures in
+    FULL_EXPECTED_INTERFACES. To accept an intentional change to the generated code, run these tests
+    with the MOONWORM_UPDATE_EXPECTED_INTERFACES environment variable set to 1 and review the diff:
+
+        MOONWORM_UPDATE_EXPECTED_INTERFACES=1 python -m pytest moonworm/tests/generators/test_brownie.py
+    """
+
+    maxDiff = None
+
+    @classmethod
+    def setUpClass(cls):
+        if os.environ.get(UPDATE_EXPECTED_INTERFACES_ENV_VAR) == "1":
+            update_expected_interfaces()
+
+        with open(EXPECTED_DIGESTS_PATH, "r") as ifp:
+            expected = json.load(ifp)
+        cls.black_version = expected["black_version"]
+        cls.digests = expected["digests"]
+
+    def check_generated_interfaces(self, format: bool) -> None:
+        kind = "formatted" if format else "unformatted"
+        interfaces = generate_fixture_interfaces(format)
+        self.assertListEqual(sorted(interfaces), sorted(self.digests))
+        for name, content in interfaces.items():
+            with self.subTest(name=name, format=format):
+                compile(content, f"{name}.py", "exec")
+                if name in FULL_EXPECTED_INTERFACES:
+                    with open(expected_interface_path(name, format), "r") as ifp:
+                        self.assertEqual(content, ifp.read())
+                digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+                self.assertEqual(digest, self.digests[name][kind])
+
+    def test_unformatted_interfaces(self):
+        self.check_generated_interfaces(format=False)
+
+    def test_formatted_interfaces(self):
+        if black.__version__ != self.black_version:
+            self.skipTest(
+                f"Expected output was formatted with black {self.black_version}, found black {black.__version__}"
+            )
+        self.check_generated_interfaces(format=True)
+
+
+class TestGetTransactionConfig(unittest.TestCase):
+    def setUp(self):
+        # The generated function only needs network.accounts.load from brownie.
+        network = types.SimpleNamespace(
+            accounts=types.SimpleNamespace(load=lambda sender, password: sender)
+        )
+        namespace = {
+            "argparse": argparse,
+            "Any": Any,
+            "Dict": Dict,
+            "network": network,
+        }
+        exec(generate_get_transaction_config(), namespace)
+        self.get_transaction_config = namespace["get_transaction_config"]
+
+    def transaction_args(self, **kwargs) -> argparse.Namespace:
+        args = {
+            "sender": "signer",
+            "password": None,
+            "gas_price": None,
+            "max_fee_per_gas": None,
+            "max_priority_fee_per_gas": None,
+            "confirmations": None,
+            "nonce": None,
+            "value": None,
+        }
+        args.update(kwargs)
+        return argparse.Namespace(**args)
+
+    def test_get_transaction_config_value(self):
+        transaction_config = self.get_transaction_config(
+            self.transaction_args(value="1 ether")
+        )
+        self.assertDictEqual(transaction_config, {"from": "signer", "value": "1 ether"})
+
+    def test_get_transaction_config_no_value(self):
+        transaction_config = self.get_transaction_config(self.transaction_args())
+        self.assertDictEqual(transaction_config, {"from": "signer"})
+
+
+if __name__ == "__main__":
+    unittest.main()
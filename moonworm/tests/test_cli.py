@@ -0,0 +1,71 @@
+import json
+import os
+import tempfile
+import unittest
+
+from ..cli import generate_argument_parser, handle_brownie_generate
+from ..generators.brownie import generate_brownie_interface
+from .generators.test_brownie import erc20_contract_build
+
+
+class TestGenerateBrownieArguments(unittest.TestCase):
+    def setUp(self):
+        self.parser = generate_argument_parser()
+
+    def test_format_by_default(self):
+        args = self.parser.parse_args(
+            ["generate-brownie", "-o", "out", "-n", "OwnableERC20", "-p", "."]
+        )
+        self.assertTrue(args.format)
+        self.assertEqual(args.func, handle_brownie_generate)
+
+    def test_no_format(self):
+        args = self.parser.parse_args(
+            [
+                "generate-brownie",
+                "-o",
+                "out",
+                "-n",
+                "OwnableERC20",
+                "-p",
+                ".",
+                "--no-format",
+            ]
+        )
+        self.assertFalse(args.format)
+        self.assertEqual(args.func, handle_brownie_generate)
+
+    def test_no_format_generates_unformatted_interface(self):
+        with tempfile.TemporaryDirectory() as project_dir:
+            build_dir = os.path.join(project_dir, "build", "contracts")
+            os.makedirs(build_dir)
+            build = erc20_contract_build()
+            with open(os.path.join(build_dir, "OwnableERC20.json"), "w") as ofp:
+                json.dump(build, ofp)
+
+            outdir = os.path.join(project_dir, "generated")
+            args = self.parser.parse_args(
+                [
+                    "generate-brownie",
+                    "-o",
+                    outdir,
+                    "-n",
+                    "OwnableERC20",
+                    "-p",
+                    project_dir,
+                    "--no-format",
+                ]
+            )
+            args.func(args)
+
+            with open(os.path.join(outdir, "OwnableERC20.py"), "r") as ifp:
+                generated = ifp.read()
+
+        expected = generate_brownie_interface(
+            build["abi"], build, "OwnableERC20", '".."', format=False
+        )
+        self.assertEqual(generated, expected)
+
+
+if __name__ == "__main__":
+    unittest.main()